@@ -8,22 +8,29 @@ tool
 @export var tile_size: float = 10.0
 
 onready var player := get_node_or_null(player_path)
-var loaded_chunks := {} # Dictionary keyed by Vector2(x,z) -> Array of spawned Nodes
+var loaded_chunks := {} # Dictionary keyed by Vector2i(x,z) -> Array of spawned Nodes
+var _center_chunk = null # Vector2i chunk the player was in when chunks were last refreshed
 
 func _physics_process(_delta):
 	if not Engine.is_editor_hint():
 		if not player:
 			return
-		var p = player.global_transform.origin
-		var cx = int(floor(p.x / (chunk_size * tile_size)))
-		var cz = int(floor(p.z / (chunk_size * tile_size)))
+		var p: Vector3 = player.global_transform.origin
+		var chunk_world := chunk_size * tile_size
+		var cx := int(floor(p.x / chunk_world))
+		var cz := int(floor(p.z / chunk_world))
+		# the wanted set only changes when the player crosses a chunk border
+		var center := Vector2i(cx, cz)
+		if _center_chunk != null and center == _center_chunk:
+			return
+		_center_chunk = center
 		_ensure_chunks(cx, cz)
 
 func _ensure_chunks(cx: int, cz: int) -> void:
-	var want = []
+	var want := {} # used as a set: Vector2i -> true, O(1) membership tests
 	for dx in range(-chunk_radius, chunk_radius+1):
 		for dz in range(-chunk_radius, chunk_radius+1):
-			want.append(Vector2(cx+dx, cz+dz))
+			want[Vector2i(cx+dx, cz+dz)] = true
 
 	# unload chunks not wanted
 	for key in loaded_chunks.keys():
@@ -40,13 +47,14 @@ func _ensure_chunks(cx: int, cz: int) -> void:
 
 func _generate_chunk(cx: int, cz: int) -> Array:
 	# spawn a simple grid of straight road tiles as placeholder
-	var spawned = []
-	var base_x = cx * chunk_size * tile_size
-	var base_z = cz * chunk_size * tile_size
-	var tile_scene = preload("res://Scenes/Tiles/StraightRoad.tscn")
+	var spawned := []
+	var chunk_world := chunk_size * tile_size
+	var base_x := cx * chunk_world
+	var base_z := cz * chunk_world
+	var tile_scene: PackedScene = preload("res://Scenes/Tiles/StraightRoad.tscn")
 	for x in range(chunk_size):
 		for z in range(chunk_size):
-			var instance = tile_scene.instantiate() as Node3D
+			var instance := tile_scene.instantiate() as Node3D
 			instance.translation = Vector3(base_x + x * tile_size, 0, base_z + z * tile_size)
 			add_child(instance)
 			spawned.append(instance)
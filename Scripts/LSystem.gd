@@ -2,13 +2,15 @@ extends Node
 tool
 
 # Generates an L-System string from an axiom and rules
+# Each pass collects the rewritten pieces and joins them once, instead of
+# growing a String with += (which can reallocate on every append).
 func generate_lsystem(axiom: String, rules: Dictionary, iterations: int) -> String:
 	var result := axiom
 	for i in range(iterations):
-		var new_result := ""
+		var parts := PackedStringArray()
 		for c in result:
-			new_result += rules.get(c, str(c))
-		result = new_result
+			parts.append(rules.get(c, c))
+		result = "".join(parts)
 	return result
 
 # Interpret the L-System string and place tiles using a mapping of characters to PackedScene
@@ -24,45 +26,23 @@ func generate_lsystem(axiom: String, rules: Dictionary, iterations: int) -> Stri
 func interpret_lsystem(lsys: String, tile_mapping: Dictionary, start_pos: Vector3, tile_size: float, parent: Node) -> Array:
 	var placed := []
 	var dir_list := [Vector3(0,0,1), Vector3(1,0,0), Vector3(0,0,-1), Vector3(-1,0,0)]
+	# yaw for each direction, computed once instead of an atan2 per placed tile
+	var yaw_list := []
+	for d in dir_list:
+		yaw_list.append(atan2(d.x, d.z))
 	var dir_idx := 0
 	var pos := start_pos
 	var stack = []
 
 	for ch in lsys:
 		match ch:
-			"F":
-				if tile_mapping.has("F"):
-					var scene := tile_mapping["F"]
+			"F", "C", "T", "X":
+				# all tile tokens place their mapped scene (if any) and advance one tile
+				var scene = tile_mapping.get(ch)
+				if scene != null:
 					var node := scene.instantiate() as Node3D
 					node.position = pos
-					node.rotation = Vector3(0, atan2(dir_list[dir_idx].x, dir_list[dir_idx].z), 0)
-					parent.add_child(node)
-					placed.append(node)
-				pos += dir_list[dir_idx] * tile_size
-			"C":
-				if tile_mapping.has("C"):
-					var scene := tile_mapping["C"]
-					var node := scene.instantiate() as Node3D
-					node.position = pos
-					node.rotation = Vector3(0, atan2(dir_list[dir_idx].x, dir_list[dir_idx].z), 0)
-					parent.add_child(node)
-					placed.append(node)
-				pos += dir_list[dir_idx] * tile_size
-			"T":
-				if tile_mapping.has("T"):
-					var scene := tile_mapping["T"]
-					var node := scene.instantiate() as Node3D
-					node.position = pos
-					node.rotation = Vector3(0, atan2(dir_list[dir_idx].x, dir_list[dir_idx].z), 0)
-					parent.add_child(node)
-					placed.append(node)
-				pos += dir_list[dir_idx] * tile_size
-			"X":
-				if tile_mapping.has("X"):
-					var scene := tile_mapping["X"]
-					var node := scene.instantiate() as Node3D
-					node.position = pos
-					node.rotation = Vector3(0, atan2(dir_list[dir_idx].x, dir_list[dir_idx].z), 0)
+					node.rotation = Vector3(0, yaw_list[dir_idx], 0)
 					parent.add_child(node)
 					placed.append(node)
 				pos += dir_list[dir_idx] * tile_size
@@ -77,8 +57,8 @@ func interpret_lsystem(lsys: String, tile_mapping: Dictionary, start_pos: Vector
 					var s = stack.pop_back()
 					pos = s["pos"]
 					dir_idx = s["dir_idx"]
-				_:
-					# ignore unknown symbols
-					pass
+			_:
+				# ignore unknown symbols
+				pass
 
 	return placed
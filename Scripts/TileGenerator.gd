@@ -10,10 +10,14 @@ tool
 @export var lsystem_iterations: int = 2
 # mapping: char -> PackedScene (assign in inspector via the resource picker)
 @export var tile_mapping: Dictionary = {}
+# 0 = new random layout on every generation; any other value is reproducible
+@export var seed: int = 0
 
 var generated_tiles: Array[Node3D] = []
+var rng := RandomNumberGenerator.new()
 
-onready var lsys = preload("res://Scripts/LSystem.gd").new()
+const LSystemScript = preload("res://Scripts/LSystem.gd")
+var lsys # LSystem helper, created on first use so grid-only generators never instance it
 
 func generate_city() -> void:
 	clear_city()
@@ -22,23 +26,30 @@ func generate_city() -> void:
 		if tile_mapping.empty():
 			push_error("tile_mapping is empty — assign mappings for F/C/T/X in the inspector.")
 			return
+		if lsys == null:
+			lsys = LSystemScript.new()
 		var lstring := lsys.generate_lsystem(lsystem_axiom, lsystem_rules, lsystem_iterations)
 		var placed = lsys.interpret_lsystem(lstring, tile_mapping, Vector3.ZERO, tile_size, self)
-		for p in placed:
-			generated_tiles.append(p)
+		generated_tiles.append_array(placed)
 		return
 
 	# fallback: simple grid generation
 	if tile_scenes.empty():
 		push_error("tile_scenes is empty — assignez au moins une scène de tuile dans l'inspecteur.")
 		return
+	if seed != 0:
+		rng.seed = seed
+	else:
+		rng.randomize()
+	var scene_count := tile_scenes.size()
 	for x in range(-grid_size, grid_size):
+		var px := x * tile_size
 		for z in range(-grid_size, grid_size):
-			var packed := tile_scenes[randi() % tile_scenes.size()]
+			var packed := tile_scenes[rng.randi() % scene_count]
 			if packed == null:
 				continue
 			var tile := packed.instantiate() as Node3D
-			tile.position = Vector3(x * tile_size, 0.0, z * tile_size)
+			tile.position = Vector3(px, 0.0, z * tile_size)
 			add_child(tile)
 			generated_tiles.append(tile)
 
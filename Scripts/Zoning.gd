@@ -5,14 +5,23 @@ tool
 # Simple zoning generator per chunk. Colors: Business=red, Commercial=blue, Residential=orange, Park=green
 enum Zone {BUSINESS, COMMERCIAL, RESIDENTIAL, PARK}
 
+const ZONE_COLORS := {
+	Zone.BUSINESS: Color(1,0.2,0.2),
+	Zone.COMMERCIAL: Color(0.2,0.4,1),
+	Zone.RESIDENTIAL: Color(1,0.6,0.2),
+	Zone.PARK: Color(0.2,0.8,0.2),
+}
+
 @export var chunk_size_tiles: int = 8
 @export var tile_size: float = 10.0
 @export var seed: int = 0
 
-var zone_cache := {} # Vector2(cx,cz) -> Zone
+var zone_cache := {} # Vector2i(cx,cz) -> Zone
+var _plane_mesh: PlaneMesh # shared by every zone plane, rebuilt if the chunk size changes
+var _zone_materials := {} # Zone -> StandardMaterial3D shared by all planes of that zone
 
 func get_zone(cx: int, cz: int) -> int:
-	var key = Vector2(cx, cz)
+	var key := Vector2i(cx, cz)
 	if zone_cache.has(key):
 		return zone_cache[key]
 	# deterministic simple hash
@@ -32,23 +41,29 @@ func get_zone(cx: int, cz: int) -> int:
 
 func create_zone_plane(cx: int, cz: int) -> Node3D:
 	var plane = MeshInstance3D.new()
-	var m = PlaneMesh.new()
-	m.size = Vector2(chunk_size_tiles * tile_size, chunk_size_tiles * tile_size)
-	plane.mesh = m
+	plane.mesh = _get_plane_mesh()
+	plane.material_override = _get_zone_material(get_zone(cx, cz))
+	plane.rotation = Vector3(-PI/2, 0, 0)
+	var chunk_world := chunk_size_tiles * tile_size
+	var half := chunk_world / 2.0
+	plane.translation = Vector3(cx * chunk_world + half, 0.05, cz * chunk_world + half)
+	return plane
+
+func _get_zone_material(zone: int) -> StandardMaterial3D:
+	if _zone_materials.has(zone):
+		return _zone_materials[zone]
 	var mat = StandardMaterial3D.new()
-	match get_zone(cx, cz):
-		Zone.BUSINESS:
-			mat.albedo_color = Color(1,0.2,0.2)
-		Zone.COMMERCIAL:
-			mat.albedo_color = Color(0.2,0.4,1)
-		Zone.RESIDENTIAL:
-			mat.albedo_color = Color(1,0.6,0.2)
-		Zone.PARK:
-			mat.albedo_color = Color(0.2,0.8,0.2)
+	mat.albedo_color = ZONE_COLORS[zone]
 	mat.transparency = BaseMaterial3D.TRANSPARENCY_ALPHA
 	mat.albedo_color.a = 0.35
-	plane.material_override = mat
-	plane.rotation = Vector3(-PI/2, 0, 0)
-	plane.translation = Vector3(cx * chunk_size_tiles * tile_size + (chunk_size_tiles*tile_size)/2.0, 0.05, cz * chunk_size_tiles * tile_size + (chunk_size_tiles*tile_size)/2.0)
-	return plane
+	_zone_materials[zone] = mat
+	return mat
+
+func _get_plane_mesh() -> PlaneMesh:
+	var chunk_world := chunk_size_tiles * tile_size
+	var size := Vector2(chunk_world, chunk_world)
+	if _plane_mesh == null or _plane_mesh.size != size:
+		_plane_mesh = PlaneMesh.new()
+		_plane_mesh.size = size
+	return _plane_mesh
 """
\ No newline at end of file